@@ -1,38 +1,78 @@
+import argparse
+import bisect
+import functools
 import json
 import os
+import sqlite3
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import List, Optional
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, Optional
+
+# Optional speed-up only; JSON is just the tags column and the legacy import
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_VALID_PRIORITIES = frozenset(("low", "medium", "high"))
+_PRIO_RANK = {"low": 0, "medium": 1, "high": 2}
+
+
+def _dumps(obj) -> bytes:
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(buf):
+    return orjson.loads(buf) if orjson else json.loads(buf)
 
 # ----------------------------
 # Task Model
 # ----------------------------
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Slotted dataclass: no per-instance __dict__, cheaper attribute access.
+# eq=False keeps identity equality, so list.remove() doesn't compare fields.
+@dataclass(slots=True, eq=False)
 class Task:
-    def __init__(self, id: int, title: str, description: str = "",
-                 priority: str = "medium", tags: List[str] = None,
-                 due_date: Optional[str] = None, completed: bool = False,
-                 created_at: str = None):
-
-        self.id = id
-        self.title = title
-        self.description = description
-        self.priority = priority
-        self.tags = tags or []
-        self.due_date = due_date  # Format: "YYYY-MM-DD"
-        self.completed = completed
-        self.created_at = created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    id: int
+    title: str
+    description: str = ""
+    priority: str = "medium"
+    tags: List[str] = field(default_factory=list)
+    due_date: Optional[str] = None  # Format: "YYYY-MM-DD"
+    completed: bool = False
+    created_at: str = field(default_factory=_now)
+
+    # Derived lookup fields (not persisted), kept current by refresh()
+    _title_lc: str = field(init=False, repr=False, default="")
+    _desc_lc: str = field(init=False, repr=False, default="")
+    _tags_set: FrozenSet[str] = field(init=False, repr=False, default=frozenset())
+    _priority_rank: int = field(init=False, repr=False, default=1)
+
+    # Keep the old constructor's handling of explicit None values
+    def __post_init__(self):
+        if self.tags is None:
+            self.tags = []
+        if not self.created_at:
+            self.created_at = _now()
+        self.refresh()
+
+    # Recompute derived fields; call after changing title, description, tags or priority
+    def refresh(self):
+        self._title_lc = self.title.lower()
+        self._desc_lc = self.description.lower()
+        self._tags_set = frozenset(self.tags)
+        self._priority_rank = _PRIO_RANK.get(self.priority, 1)
 
     # Convert task to dictionary for JSON
     def to_dict(self):
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "priority": self.priority,
-            "tags": self.tags,
-            "due_date": self.due_date,
-            "completed": self.completed,
-            "created_at": self.created_at
-        }
+        return {name: getattr(self, name) for name in _FIELDS}
 
     # Recreate a Task instance from dictionary
     @staticmethod
@@ -40,71 +80,295 @@ class Task:
         return Task(**data)
 
 
+# Persisted Task fields, in declaration order
+_FIELDS = tuple(f.name for f in fields(Task) if f.init)
+
+# Sort keys by menu choice; the task list is kept ordered by one of these
+_SORT_KEYS = {
+    "1": attrgetter("_priority_rank"),
+    "2": attrgetter("_title_lc"),
+    "3": attrgetter("created_at"),
+}
+
+
+# Split comma separated tags into a cleaned, lowercased list (single pass)
+def _parse_tags(raw):
+    return [s for s in (t.strip().lower() for t in raw.split(",")) if s]
+
+
+# SQLite schema; bump _SCHEMA_VERSION and add a migration step when it changes.
+# Each step is a tuple of single statements, run with execute() inside the
+# step's transaction (executescript() would commit part-way through).
+_SCHEMA_VERSION = 5
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT '',
+        priority TEXT NOT NULL DEFAULT 'medium',
+        tags TEXT NOT NULL DEFAULT '[]',
+        due_date TEXT,
+        completed INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_done_created ON tasks(completed, created_at)",
+)
+
+# Schema version 3: ordered index for the priority filter
+_PRIO_CREATED_INDEX = (
+    "CREATE INDEX IF NOT EXISTS ix_prio_created ON tasks(priority, created_at)",
+)
+
+# Full-text index over title/description, kept in sync by triggers. The
+# trigram tokenizer gives case-insensitive substring matches (3+ chars).
+_FTS_SCHEMA = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content='tasks', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+)
+
+# Schema version 4: only reindex a task when its text actually changed
+_FTS_UPDATE_TRIGGER = (
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    """CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks
+    WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+    BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+)
+
+# Schema version 5: no query uses (priority, completed, created_at), which
+# earlier versions created; drop it so writes stop maintaining it
+_DROP_PRIO_DONE_INDEX = (
+    "DROP INDEX IF EXISTS ix_prio_done_created",
+)
+
+# Trigrams need 3+ characters. FTS5 also folds non-ASCII case differently
+# from str.lower() (e.g. "İ", final sigma), so only ASCII keywords use the
+# index; anything else goes through the in-memory scan.
+_FTS_MIN_KEYWORD = 3
+
+_INSERT_SQL = (
+    f"INSERT INTO tasks ({', '.join(_FIELDS)}) "
+    f"VALUES ({', '.join(':' + name for name in _FIELDS)})"
+)
+
+
+# Task <-> database row; tags are stored as a JSON array
+def _to_row(task):
+    row = task.to_dict()
+    row["tags"] = _dumps(row["tags"]).decode()
+    return row
+
+
+# Columns load_tasks selects, in the order _from_row unpacks them
+_ROW_COLUMNS = ("id", "title", "description", "priority",
+                "tags", "due_date", "completed", "created_at")
+
+
+# Bulk-load path: rows are always complete, so skip Task.__init__ and its
+# defaulting and assign the slots directly; only derived fields are computed
+def _from_row(row):
+    task = Task.__new__(Task)
+    (task.id, task.title, task.description, task.priority,
+     tags, task.due_date, completed, task.created_at) = row
+    task.tags = _loads(tags)
+    task.completed = bool(completed)
+    task.refresh()
+    return task
+
+
+# Render one task as a block for view_tasks
+def _fmt_task(task):
+    status = "✔ Completed" if task.completed else "❌ Not Completed"
+    return f"""
+ID: {task.id}
+Title: {task.title}
+Description: {task.description}
+Priority: {task.priority}
+Tags: {task.tags}
+Due Date: {task.due_date}
+Created At: {task.created_at}
+Status: {status}
+------------------------------
+
+"""
+
+
 # ----------------------------
 # Todo Manager
 # ----------------------------
 class TodoManager:
-    def __init__(self, filename="tasks.json"):
+    def __init__(self, filename="tasks.json", input_fn=input):
         self.filename = filename
+        self._input = input_fn  # prompt reader; a script reader in batch mode
+        self.log_filename = os.path.splitext(filename)[0] + ".log.jsonl"
+        self.db_filename = os.path.splitext(filename)[0] + ".db"
         self.tasks: List[Task] = []
+        self._by_id: Dict[int, Task] = {}
+        self._sort_key = _SORT_KEYS["3"]
+        self.conn = sqlite3.connect(self.db_filename)
+        self._init_db()
+        self._has_fts = self._fts_exists()
+        # Per-instance cache of keyword -> matching ids; cleared on any edit
+        self._search_cache = functools.lru_cache(maxsize=128)(self._search_ids)
         self.load_tasks()
 
-    # Load tasks from JSON
+    # Create or migrate the schema; a new database imports legacy JSON tasks.
+    # Each version step commits together with its user_version bump, so a
+    # failure leaves the database at the last completed version.
+    def _init_db(self):
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        for target in range(version + 1, _SCHEMA_VERSION + 1):
+            self.conn.execute("BEGIN")
+            with self.conn:
+                self._migrate_to(target)
+                self.conn.execute(f"PRAGMA user_version = {target}")
+
+    def _migrate_to(self, target):
+        if target == 1:
+            self._execute_all(_SCHEMA)
+            self.conn.executemany(_INSERT_SQL, map(_to_row, self._read_legacy_json()))
+        elif target == 2:
+            self.conn.execute("SAVEPOINT fts")
+            try:
+                self._execute_all(_FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                # No FTS5/trigram support; search_tasks scans instead
+                self.conn.execute("ROLLBACK TO fts")
+            self.conn.execute("RELEASE fts")
+        elif target == 3:
+            self._execute_all(_PRIO_CREATED_INDEX)
+        elif target == 4 and self._fts_exists():
+            self._execute_all(_FTS_UPDATE_TRIGGER)
+        elif target == 5:
+            self._execute_all(_DROP_PRIO_DONE_INDEX)
+
+    def _execute_all(self, statements):
+        for statement in statements:
+            self.conn.execute(statement)
+
+    def _fts_exists(self):
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'"
+        ).fetchone() is not None
+
+    # Read tasks.json plus its JSONL mutation log (the pre-SQLite format)
+    def _read_legacy_json(self):
+        data = {}
+        try:
+            with open(self.filename, "rb") as f:
+                for task in _loads(f.read()):
+                    data[task["id"]] = task
+        except FileNotFoundError:
+            pass
+
+        try:
+            with open(self.log_filename, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        op = _loads(line)
+                    except ValueError:
+                        break  # torn last line from an interrupted write
+                    if op["op"] == "add":
+                        data.setdefault(op["task"]["id"], op["task"])
+                    elif op["op"] == "del":
+                        data.pop(op["id"], None)
+                    elif op["op"] == "upd" and op["id"] in data:
+                        data[op["id"]].update(op["fields"])
+        except FileNotFoundError:
+            pass
+
+        return [Task.from_dict(task) for task in data.values()]
+
+    # Load all tasks from the database, in creation order
     def load_tasks(self):
-        if os.path.exists(self.filename):
-            with open(self.filename, "r") as f:
-                data = json.load(f)
-                self.tasks = [Task.from_dict(task) for task in data]
-        else:
-            self.tasks = []
-
-    # Save tasks to JSON
-    def save_tasks(self):
-        with open(self.filename, "w") as f:
-            json.dump([task.to_dict() for task in self.tasks], f, indent=4)
-
-    # Generate new task ID
-    def generate_id(self):
-        return max([task.id for task in self.tasks], default=0) + 1
+        rows = self.conn.execute(
+            f"SELECT {', '.join(_ROW_COLUMNS)} FROM tasks ORDER BY created_at, id"
+        )
+        self.tasks = [_from_row(row) for row in rows]
+        self._by_id = {task.id: task for task in self.tasks}
+        self._sort_key = _SORT_KEYS["3"]
+        self._search_cache.cache_clear()
+
+    # Insert a new task row; SQLite assigns the id, so concurrent
+    # instances can't overwrite each other's tasks
+    def _insert_task(self, task):
+        row = _to_row(task)
+        row["id"] = None
+        with self.conn:
+            task.id = self.conn.execute(_INSERT_SQL, row).lastrowid
+
+    # Write only the given (changed) columns of an existing task row
+    def _update_task(self, task, names):
+        assignments = ", ".join(f"{name} = :{name}" for name in names)
+        with self.conn:
+            self.conn.execute(f"UPDATE tasks SET {assignments} WHERE id = :id", _to_row(task))
+
+    def close(self):
+        self.conn.close()
 
     # Add a new task
     def add_task(self):
-        title = input("Enter task title: ")
-        description = input("Enter task description: ")
+        title = self._input("Enter task title: ")
+        description = self._input("Enter task description: ")
 
-        priority = input("Priority (low/medium/high): ").lower()
-        if priority not in ["low", "medium", "high"]:
+        priority = self._input("Priority (low/medium/high): ").lower()
+        if priority not in _VALID_PRIORITIES:
             priority = "medium"
 
-        tags = input("Tags (comma separated): ").lower().split(",")
+        tags = _parse_tags(self._input("Tags (comma separated): "))
 
-        due_date = input("Due date (YYYY-MM-DD or blank): ")
+        due_date = self._input("Due date (YYYY-MM-DD or blank): ")
         if due_date.strip() == "":
             due_date = None
 
         new_task = Task(
-            id=self.generate_id(),
+            id=None,  # assigned by the database on insert
             title=title,
             description=description,
             priority=priority,
-            tags=[t.strip() for t in tags if t.strip()],
+            tags=tags,
             due_date=due_date
         )
 
-        self.tasks.append(new_task)
-        self.save_tasks()
+        self._insert_task(new_task)
+        bisect.insort(self.tasks, new_task, key=self._sort_key)
+        self._by_id[new_task.id] = new_task
+        self._search_cache.cache_clear()
         print("Task added successfully!")
 
     # Delete a task
     def delete_task(self):
-        task_id = int(input("Enter task ID to delete: "))
-        self.tasks = [task for task in self.tasks if task.id != task_id]
-        self.save_tasks()
+        task_id = int(self._input("Enter task ID to delete: "))
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            print("Task not found.")
+            return
+
+        self.tasks.remove(task)
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        self._search_cache.cache_clear()
         print("Task deleted.")
 
     # Update task
     def update_task(self):
-        task_id = int(input("Enter task ID to update: "))
+        task_id = int(self._input("Enter task ID to update: "))
         task = self.find_task(task_id)
 
         if not task:
@@ -113,34 +377,45 @@ class TodoManager:
 
         print("Leave blank to keep current value.")
 
-        title = input(f"New title (current: {task.title}): ")
-        description = input(f"New description (current: {task.description}): ")
+        title = self._input(f"New title (current: {task.title}): ")
+        description = self._input(f"New description (current: {task.description}): ")
 
-        priority = input(f"Priority (low/medium/high) (current: {task.priority}): ").lower()
+        priority = self._input(f"Priority (low/medium/high) (current: {task.priority}): ").lower()
 
-        tags = input(f"Tags comma separated (current: {task.tags}): ")
-        due_date = input(f"Due date YYYY-MM-DD (current: {task.due_date}): ")
+        tags = self._input(f"Tags comma separated (current: {task.tags}): ")
+        due_date = self._input(f"Due date YYYY-MM-DD (current: {task.due_date}): ")
 
+        changes = {}
         if title:
-            task.title = title
+            changes["title"] = title
         if description:
-            task.description = description
+            changes["description"] = description
 
-        if priority in ["low", "medium", "high"]:
-            task.priority = priority
+        if priority in _VALID_PRIORITIES:
+            changes["priority"] = priority
 
         if tags.strip():
-            task.tags = [t.strip() for t in tags.split(",")]
+            changes["tags"] = _parse_tags(tags)
 
         if due_date.strip():
-            task.due_date = due_date
-
-        self.save_tasks()
+            changes["due_date"] = due_date
+
+        if changes:
+            old_key = self._sort_key(task)
+            for key, value in changes.items():
+                setattr(task, key, value)
+            task.refresh()
+            # Move the task if the edit changed its position in the sort order
+            if self._sort_key(task) != old_key:
+                self.tasks.remove(task)
+                bisect.insort(self.tasks, task, key=self._sort_key)
+            self._update_task(task, changes)
+            self._search_cache.cache_clear()
         print("Task updated.")
 
     # Mark complete / incomplete
     def toggle_complete(self):
-        task_id = int(input("Enter task ID to toggle completion: "))
+        task_id = int(self._input("Enter task ID to toggle completion: "))
         task = self.find_task(task_id)
 
         if not task:
@@ -148,15 +423,13 @@ class TodoManager:
             return
 
         task.completed = not task.completed
-        self.save_tasks()
+        self._update_task(task, ("completed",))
+        self._search_cache.cache_clear()
         print("Task status changed.")
 
     # Find task by ID
     def find_task(self, task_id):
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
 
     # View tasks
     def view_tasks(self):
@@ -164,33 +437,48 @@ class TodoManager:
             print("\nNo tasks found.\n")
             return
 
-        print("\n-------- TASK LIST --------")
-        for task in self.tasks:
-            status = "✔ Completed" if task.completed else "❌ Not Completed"
-            print(f"""
-ID: {task.id}
-Title: {task.title}
-Description: {task.description}
-Priority: {task.priority}
-Tags: {task.tags}
-Due Date: {task.due_date}
-Created At: {task.created_at}
-Status: {status}
-------------------------------
-""")
+        # Build the whole listing and emit it with a single write
+        out = ["\n-------- TASK LIST --------\n"]
+        out.extend(_fmt_task(task) for task in self.tasks)
+        sys.stdout.write("".join(out))
 
     # Search tasks by keyword
     def search_tasks(self):
-        keyword = input("Enter keyword: ").lower()
-        results = [t for t in self.tasks if keyword in t.title.lower() or keyword in t.description.lower()]
+        keyword = self._input("Enter keyword: ").lower()
+        results = self._search_cache(keyword)
 
         if not results:
             print("No matching tasks.")
             return
 
         print("\nSearch Results:")
-        for t in results:
-            print(f"- {t.id} | {t.title}")
+        for task_id in results:
+            print(f"- {task_id} | {self._by_id[task_id].title}")
+
+    # Ids of tasks whose title or description contains the (lowercase)
+    # keyword, in the current list order whichever path finds them
+    def _search_ids(self, keyword):
+        if self._has_fts and len(keyword) >= _FTS_MIN_KEYWORD and keyword.isascii():
+            # Quote as an FTS5 phrase so the keyword is matched literally
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            rows = self.conn.execute(
+                "SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?", (phrase,)
+            )
+            matches = self._in_view_order(rows)
+        else:
+            matches = [t for t in self.tasks
+                       if keyword in t._title_lc or keyword in t._desc_lc]
+            matches.sort(key=lambda t: (self._sort_key(t), t.id))
+
+        return tuple(t.id for t in matches)
+
+    # Resolve (id,) rows from a query to loaded tasks, ordered like the list
+    def _in_view_order(self, rows):
+        # Skip rows another instance added since this one loaded
+        matches = [self._by_id[task_id] for (task_id,) in rows
+                   if task_id in self._by_id]
+        matches.sort(key=lambda t: (self._sort_key(t), t.id))
+        return matches
 
     # Filter by priority or completion
     def filter_tasks(self):
@@ -199,20 +487,22 @@ Status: {status}
 2. Filter by not completed
 3. Filter by priority
 """)
-        choice = input("Choose option: ")
+        choice = self._input("Choose option: ")
 
+        # Matching ids come from covering scans of the (completed, ...) and
+        # (priority, ...) indexes; display follows the current sort order
         if choice == "1":
-            filtered = [t for t in self.tasks if t.completed]
+            rows = self.conn.execute("SELECT id FROM tasks WHERE completed = 1")
         elif choice == "2":
-            filtered = [t for t in self.tasks if not t.completed]
+            rows = self.conn.execute("SELECT id FROM tasks WHERE completed = 0")
         elif choice == "3":
-            p = input("Enter priority (low/medium/high): ")
-            filtered = [t for t in self.tasks if t.priority == p]
+            p = self._input("Enter priority (low/medium/high): ")
+            rows = self.conn.execute("SELECT id FROM tasks WHERE priority = ?", (p,))
         else:
             print("Invalid choice.")
             return
 
-        for t in filtered:
+        for t in self._in_view_order(rows):
             print(f"- {t.id} | {t.title} | {t.priority}")
 
     # Sort tasks
@@ -223,30 +513,23 @@ Status: {status}
 3. Sort by creation date
 """)
 
-        choice = input("Choose sort option: ")
+        choice = self._input("Choose sort option: ")
 
-        if choice == "1":
-            self.tasks.sort(key=lambda x: ["low", "medium", "high"].index(x.priority))
-        elif choice == "2":
-            self.tasks.sort(key=lambda x: x.title.lower())
-        elif choice == "3":
-            self.tasks.sort(key=lambda x: x.created_at)
-        else:
+        if choice not in _SORT_KEYS:
             print("Invalid choice.")
             return
 
-        self.save_tasks()
+        # One full sort; add/update keep the list ordered from here on
+        self._sort_key = _SORT_KEYS[choice]
+        self.tasks.sort(key=self._sort_key)
+        self._search_cache.cache_clear()
         print("Tasks sorted.")
 
 
 # ----------------------------
 # Console Menu
 # ----------------------------
-def main():
-    manager = TodoManager()
-
-    while True:
-        print("""
+MENU = """
 ========== TODO APP ==========
 1. Add Task
 2. Delete Task
@@ -257,31 +540,74 @@ def main():
 7. Filter Tasks
 8. Sort Tasks
 9. Exit
-""")
-
-        choice = input("Choose an option: ")
-
-        if choice == "1":
-            manager.add_task()
-        elif choice == "2":
-            manager.delete_task()
-        elif choice == "3":
-            manager.update_task()
-        elif choice == "4":
-            manager.view_tasks()
-        elif choice == "5":
-            manager.toggle_complete()
-        elif choice == "6":
-            manager.search_tasks()
-        elif choice == "7":
-            manager.filter_tasks()
-        elif choice == "8":
-            manager.sort_tasks()
-        elif choice == "9":
-            print("Goodbye!")
-            break
-        else:
-            print("Invalid option, try again.")
+"""
+
+# Menu choice -> TodoManager action
+_ACTIONS = {
+    "1": TodoManager.add_task,
+    "2": TodoManager.delete_task,
+    "3": TodoManager.update_task,
+    "4": TodoManager.view_tasks,
+    "5": TodoManager.toggle_complete,
+    "6": TodoManager.search_tasks,
+    "7": TodoManager.filter_tasks,
+    "8": TodoManager.sort_tasks,
+}
+
+
+# input() replacement that answers prompts from a file's lines
+class _ScriptReader:
+    def __init__(self, path):
+        with open(path) as f:
+            self.lines = f.read().splitlines()
+        self.lineno = 0  # number of the line most recently returned
+
+    def __call__(self, prompt=""):
+        if self.lineno >= len(self.lines):
+            raise EOFError
+        self.lineno += 1
+        return self.lines[self.lineno - 1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Console todo app")
+    parser.add_argument(
+        "--script",
+        help="run in batch mode, reading menu choices and answers from "
+             "this file (one per line) instead of prompting",
+    )
+    args = parser.parse_args(argv)
+
+    read = _ScriptReader(args.script) if args.script else input
+    manager = TodoManager(input_fn=read)
+
+    try:
+        while True:
+            if not args.script:
+                print(MENU)
+
+            try:
+                choice = read("Choose an option: ")
+                if choice == "9":
+                    print("Goodbye!")
+                    break
+
+                action = _ACTIONS.get(choice)
+                if action:
+                    action(manager)
+                else:
+                    print("Invalid option, try again.")
+            except EOFError:
+                # End of script or piped stdin
+                break
+            except ValueError as exc:
+                # A non-numeric task id; skip it rather than abort the session
+                if args.script:
+                    print(f"{args.script}:{read.lineno}: invalid input ({exc}), skipped.")
+                else:
+                    print("Invalid input, try again.")
+    finally:
+        manager.close()
 
 
 if __name__ == "__main__":